@@ -4,12 +4,33 @@ Generates accurate car data for luxury and performance makes including:
 BMW, Audi, Mercedes-Benz, Lamborghini, Nissan GTR, Porsche, Ferrari, McLaren, etc.
 """
 
+import csv
+import os
 import random
-import json
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from operator import itemgetter
+
+from json_dumps import dumps, dumps_item, dumps_line
+
+VIN_CHARS = "ABCDEFGHJKLMNPRSTUVWXYZ0123456789"
+VIN_LENGTH = 17
+
 
 class CarInventoryGenerator:
-    def __init__(self):
+    def __init__(self, seed=None):
+        # A private Random instance keeps seeding reproducible without touching
+        # the global random state. Its methods are bound once so the per-car
+        # code skips the attribute lookup on every call.
+        self._rng = random.Random(seed)
+        self._choice = self._rng.choice
+        self._choices = self._rng.choices
+        self._randint = self._rng.randint
+        self._sample = self._rng.sample
+        self._randrange = self._rng.randrange
+
         self.makes_data = {
             "BMW": {
                 "models": {
@@ -315,14 +336,73 @@ class CarInventoryGenerator:
             "Lightweight Sports Package", "Aero Package", "Track Package"
         ]
 
+        # Intern every categorical value so all generated rows point into one
+        # small pool of strings, however the tables were built
+        self.exterior_colors = [sys.intern(c) for c in self.exterior_colors]
+        self.interior_colors = [sys.intern(c) for c in self.interior_colors]
+        self.options = [sys.intern(o) for o in self.options]
+
+        # Flatten makes_data into parallel per-model tables so picking a car
+        # is a single index draw followed by plain list indexing. Each model is
+        # weighted 1/len(models) so every make stays equally likely.
+        self._model_make = []
+        self._model_name = []
+        self._model_years = []
+        self._model_trims = []
+        self._model_transmissions = []
+        self._model_body_type = []
+        # hp/price ranges are stored as (lo, width) so a draw is
+        # lo + randrange(width), skipping randint's bounds arithmetic
+        self._hp_lo = []
+        self._hp_width = []
+        self._price_lo = []
+        self._price_width = []
+        self._model_cum_weights = []
+        total_weight = 0.0
+        for make, make_data in self.makes_data.items():
+            models = make_data["models"]
+            for model, model_data in models.items():
+                self._model_make.append(sys.intern(make))
+                self._model_name.append(sys.intern(model))
+                self._model_years.append(model_data["years"])
+                self._model_trims.append([sys.intern(t) for t in model_data["trims"]])
+                self._model_transmissions.append(
+                    [sys.intern(t) for t in model_data["transmission"]])
+                self._model_body_type.append(sys.intern(model_data["body_type"]))
+                hp_lo, hp_hi = model_data["hp_range"]
+                price_lo, price_hi = model_data["price_range"]
+                self._hp_lo.append(hp_lo)
+                self._hp_width.append(hp_hi - hp_lo + 1)
+                self._price_lo.append(price_lo)
+                self._price_width.append(price_hi - price_lo + 1)
+                total_weight += 1 / len(models)
+                self._model_cum_weights.append(total_weight)
+        self._model_ids = range(len(self._model_name))
+
+        # Drivetrain/fuel rules only depend on the model, so resolve them once
+        awd_makes = {"Audi", "Lamborghini", "Nissan"}
+        self._awd_forced = [
+            make in awd_makes or any(s in model for s in ("X5", "Cayenne", "Urus"))
+            for make, model in zip(self._model_make, self._model_name)
+        ]
+        self._electric = ["Taycan" in model for model in self._model_name]
+
+        # Display transmission type for each of the few distinct transmissions
+        self._trans_type_map = {
+            transmission: "DCT" if "DCT" in transmission
+            else "Manual" if "Manual" in transmission
+            else "Automatic"
+            for transmissions in self._model_transmissions
+            for transmission in transmissions
+        }
+
     def generate_vin(self):
         """Generate a realistic VIN number"""
-        chars = "ABCDEFGHJKLMNPRSTUVWXYZ0123456789"
-        return ''.join(random.choice(chars) for _ in range(17))
+        return ''.join(self._choices(VIN_CHARS, k=VIN_LENGTH))
 
     def generate_stock_number(self):
         """Generate a stock number"""
-        return f"ST{random.randint(10000, 99999)}"
+        return f"ST{self._randint(10000, 99999)}"
 
     def generate_mileage(self, year):
         """Generate realistic mileage based on year"""
@@ -330,40 +410,45 @@ class CarInventoryGenerator:
         age = current_year - year
         
         if age == 0:
-            return random.randint(5, 500)  # New/demo
+            return self._randint(5, 500)  # New/demo
         elif age == 1:
-            return random.randint(1000, 15000)
+            return self._randint(1000, 15000)
         elif age == 2:
-            return random.randint(8000, 30000)
+            return self._randint(8000, 30000)
         else:
-            return random.randint(15000, 50000)
+            return self._randint(15000, 50000)
 
     def generate_car(self):
         """Generate a single realistic car"""
-        make = random.choice(list(self.makes_data.keys()))
-        make_data = self.makes_data[make]
-        model = random.choice(list(make_data["models"].keys()))
-        model_data = make_data["models"][model]
+        return self._build_car(
+            model_id=self._choices(self._model_ids, cum_weights=self._model_cum_weights)[0],
+            stock_number=self.generate_stock_number(),
+            vin=self.generate_vin(),
+            exterior_color=self._choice(self.exterior_colors),
+            interior_color=self._choice(self.interior_colors),
+            num_options=self._randint(3, 8),
+            option_cost=self._randint(1000, 5000),
+            date_added=datetime.now().strftime("%Y-%m-%d"),
+        )
+
+    def _build_car(self, model_id, stock_number, vin, exterior_color, interior_color,
+                   num_options, option_cost, date_added):
+        """Assemble a car from the values drawn up front by the caller"""
+        make = self._model_make[model_id]
+        model = self._model_name[model_id]
         
-        year = random.choice(model_data["years"])
-        trim = random.choice(model_data["trims"])
-        hp = random.randint(model_data["hp_range"][0], model_data["hp_range"][1])
-        transmission = random.choice(model_data["transmission"])
-        body_type = model_data["body_type"]
-        base_price = random.randint(model_data["price_range"][0], model_data["price_range"][1])
+        year = self._choice(self._model_years[model_id])
+        trim = self._choice(self._model_trims[model_id])
+        hp = self._hp_lo[model_id] + self._randrange(self._hp_width[model_id])
+        transmission = self._choice(self._model_transmissions[model_id])
+        body_type = self._model_body_type[model_id]
+        base_price = self._price_lo[model_id] + self._randrange(self._price_width[model_id])
         
-        # Determine transmission type for display
-        if "DCT" in transmission:
-            trans_type = "DCT"
-        elif "Manual" in transmission:
-            trans_type = "Manual"
-        else:
-            trans_type = "Automatic"
+        trans_type = self._trans_type_map[transmission]
         
         # Add random options (3-8 options)
-        num_options = random.randint(3, 8)
-        selected_options = random.sample(self.options, num_options)
-        options_cost = len(selected_options) * random.randint(1000, 5000)
+        selected_options = self._sample(self.options, num_options)
+        options_cost = num_options * option_cost
         
         mileage = self.generate_mileage(year)
         
@@ -380,79 +465,188 @@ class CarInventoryGenerator:
             price = int((base_price + options_cost) * depreciation)
         
         car = {
-            "stock_number": self.generate_stock_number(),
-            "vin": self.generate_vin(),
+            "stock_number": stock_number,
+            "vin": vin,
             "condition": condition,
             "year": year,
             "make": make,
             "model": model,
             "trim": trim,
             "body_type": body_type,
-            "exterior_color": random.choice(self.exterior_colors),
-            "interior_color": random.choice(self.interior_colors),
+            "exterior_color": exterior_color,
+            "interior_color": interior_color,
             "mileage": mileage,
             "horsepower": hp,
             "transmission": transmission,
             "transmission_type": trans_type,
-            "drivetrain": "AWD" if make in ["Audi", "Lamborghini", "Nissan"] or "X5" in model or "Cayenne" in model or "Urus" in model else random.choice(["RWD", "AWD"]),
-            "fuel_type": "Electric" if "Taycan" in model else "Premium Gasoline",
+            "drivetrain": "AWD" if self._awd_forced[model_id] else self._choice(["RWD", "AWD"]),
+            "fuel_type": "Electric" if self._electric[model_id] else "Premium Gasoline",
             "options": selected_options,
             "price": price,
-            "date_added": datetime.now().strftime("%Y-%m-%d")
+            "date_added": date_added
         }
         
         return car
 
-    def generate_inventory(self, count=50):
+    def generate_inventory(self, count=50, workers=1):
         """Generate multiple cars"""
-        inventory = []
-        for _ in range(count):
-            inventory.append(self.generate_car())
-        return inventory
+        # Cars are independent, so large batches can be split across processes
+        # (workers=None uses one per CPU). Process start-up costs more than a
+        # few thousand cars take to generate, so this stays opt-in.
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers > 1 and count > 1:
+            return self._generate_in_parallel(count, min(workers, count))
+        
+        # Draw the model and every per-car value that doesn't depend on it in
+        # one C-level random.choices call per field, then assemble the rows.
+        model_ids = self._choices(self._model_ids, cum_weights=self._model_cum_weights, k=count)
+        stock_numbers = [f"ST{n}" for n in self._choices(range(10000, 100000), k=count)]
+        # All VIN characters come from a single draw, sliced into 17-char runs
+        vin_chars = ''.join(self._choices(VIN_CHARS, k=count * VIN_LENGTH))
+        vins = [vin_chars[i:i + VIN_LENGTH] for i in range(0, len(vin_chars), VIN_LENGTH)]
+        exterior_colors = self._choices(self.exterior_colors, k=count)
+        interior_colors = self._choices(self.interior_colors, k=count)
+        option_counts = self._choices(range(3, 9), k=count)
+        option_costs = self._choices(range(1000, 5001), k=count)
+        # Every car in the batch shares the same date string
+        today = datetime.now().strftime("%Y-%m-%d")
+        
+        return [
+            self._build_car(*row, today)
+            for row in zip(model_ids, stock_numbers, vins, exterior_colors,
+                           interior_colors, option_counts, option_costs)
+        ]
+
+    def _generate_in_parallel(self, count, workers):
+        """Generate an inventory as one shard per worker process"""
+        # Each shard gets its own seed so forked workers don't replay the
+        # parent's random stream
+        shards = [
+            (type(self), self._rng.getrandbits(64), count // workers + (i < count % workers))
+            for i in range(workers)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return [car for part in executor.map(_generate_shard, shards) for car in part]
+
+    def iter_inventory(self, count=50, batch_size=1000):
+        """Yield cars one at a time, generating them in batches"""
+        while count > 0:
+            size = min(batch_size, count)
+            yield from self.generate_inventory(size)
+            count -= size
 
     def save_to_json(self, inventory, filename="car_inventory.json"):
         """Save inventory to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(inventory, f, indent=2, ensure_ascii=False)
+        with open(filename, 'wb') as f:
+            f.write(dumps(inventory))
         print(f"✓ Saved {len(inventory)} cars to {filename}")
 
+    def save_to_ndjson(self, count=50, filename="car_inventory.ndjson"):
+        """Generate cars straight into a newline-delimited JSON file"""
+        # Only one batch is held in memory at a time, however large count is
+        with open(filename, 'wb') as f:
+            for car in self.iter_inventory(count):
+                f.write(dumps_line(car))
+        print(f"✓ Saved {count} cars to {filename}")
+
     def save_to_csv(self, inventory, filename="car_inventory.csv"):
         """Save inventory to CSV file"""
-        import csv
+        if not inventory:
+            return
         
+        fieldnames = list(inventory[0])
+        to_row = self._csv_row_builder(fieldnames)
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(map(to_row, inventory))
+        print(f"✓ Saved {len(inventory)} cars to {filename}")
+
+    def save_to_json_and_csv(self, inventory, json_filename="car_inventory.json",
+                             csv_filename="car_inventory.csv"):
+        """Save inventory to JSON and CSV files in a single pass"""
         if not inventory:
+            # Match save_to_json, which still writes an empty array
+            with open(json_filename, 'wb') as f:
+                f.write(dumps(inventory))
             return
         
-        keys = inventory[0].keys()
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
+        fieldnames = list(inventory[0])
+        to_row = self._csv_row_builder(fieldnames)
+        with open(json_filename, 'wb') as jf, \
+                open(csv_filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as cf:
+            writer = csv.writer(cf)
+            writer.writerow(fieldnames)
+            # Same layout as save_to_json, written one car at a time
+            separator = b"[\n  "
             for car in inventory:
-                # Convert list to string for CSV
-                car_copy = car.copy()
-                car_copy['options'] = '; '.join(car['options'])
-                writer.writerow(car_copy)
+                jf.write(separator)
+                jf.write(dumps_item(car))
+                writer.writerow(to_row(car))
+                separator = b",\n  "
+            jf.write(b"\n]\n")
+        print(f"✓ Saved {len(inventory)} cars to {json_filename}")
+        print(f"✓ Saved {len(inventory)} cars to {csv_filename}")
+
+    def save_to_parquet(self, inventory, filename="car_inventory.parquet"):
+        """Save inventory to a Parquet file (requires pyarrow)"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        if not inventory:
+            return
+        
+        # Columns keep their types; options stays a list<string> column
+        table = pa.Table.from_pylist(inventory)
+        pq.write_table(table, filename, compression='snappy')
         print(f"✓ Saved {len(inventory)} cars to {filename}")
 
+    def _csv_row_builder(self, fieldnames):
+        """Return a function that turns a car into a CSV row in field order"""
+        options_idx = fieldnames.index('options')
+        get_row = itemgetter(*fieldnames)
+        
+        def to_row(car):
+            # Convert list to string for CSV
+            row = list(get_row(car))
+            row[options_idx] = '; '.join(row[options_idx])
+            return row
+        
+        return to_row
+
     def print_sample(self, inventory, count=3):
         """Print sample cars"""
-        print(f"\n{'='*80}")
-        print(f"SAMPLE INVENTORY ({count} cars)")
-        print(f"{'='*80}\n")
+        # Build the whole report and write it once rather than per line
+        lines = [
+            f"\n{'='*80}",
+            f"SAMPLE INVENTORY ({count} cars)",
+            f"{'='*80}\n",
+        ]
         
         for i, car in enumerate(inventory[:count], 1):
-            print(f"Car #{i}")
-            print(f"Stock #: {car['stock_number']} | VIN: {car['vin']}")
-            print(f"{car['year']} {car['make']} {car['model']} {car['trim']}")
-            print(f"Body: {car['body_type']} | Condition: {car['condition']}")
-            print(f"Color: {car['exterior_color']} / {car['interior_color']}")
-            print(f"Mileage: {car['mileage']:,} miles")
-            print(f"Power: {car['horsepower']} HP")
-            print(f"Transmission: {car['transmission']} ({car['transmission_type']})")
-            print(f"Drivetrain: {car['drivetrain']}")
-            print(f"Options: {', '.join(car['options'][:3])}...")
-            print(f"Price: ${car['price']:,}")
-            print(f"{'-'*80}\n")
+            lines += [
+                f"Car #{i}",
+                f"Stock #: {car['stock_number']} | VIN: {car['vin']}",
+                f"{car['year']} {car['make']} {car['model']} {car['trim']}",
+                f"Body: {car['body_type']} | Condition: {car['condition']}",
+                f"Color: {car['exterior_color']} / {car['interior_color']}",
+                f"Mileage: {car['mileage']:,} miles",
+                f"Power: {car['horsepower']} HP",
+                f"Transmission: {car['transmission']} ({car['transmission_type']})",
+                f"Drivetrain: {car['drivetrain']}",
+                f"Options: {', '.join(car['options'][:3])}...",
+                f"Price: ${car['price']:,}",
+                f"{'-'*80}\n",
+            ]
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _generate_shard(shard):
+    """Generate one shard of an inventory inside a worker process"""
+    generator_cls, seed, count = shard
+    return generator_cls(seed).generate_inventory(count)
 
 
 def main():
@@ -473,15 +667,12 @@ def main():
     
     # Save to files
     print("Saving inventory to files...")
-    generator.save_to_json(inventory, "car_inventory.json")
-    generator.save_to_csv(inventory, "car_inventory.csv")
+    generator.save_to_json_and_csv(inventory, "car_inventory.json", "car_inventory.csv")
     
     print(f"\n✓ Successfully generated {len(inventory)} cars!")
     print("✓ Files created: car_inventory.json, car_inventory.csv")
     print("\nInventory Statistics:")
-    makes = {}
-    for car in inventory:
-        makes[car['make']] = makes.get(car['make'], 0) + 1
+    makes = Counter(car['make'] for car in inventory)
     
     for make, count in sorted(makes.items()):
         print(f"  {make}: {count} cars")
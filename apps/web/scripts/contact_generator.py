@@ -8,13 +8,79 @@ Generates realistic fake customer data including:
 - Additional demographic info
 """
 
+import gzip
+import os
+import queue
 import random
-import json
 import csv
-from datetime import datetime, timedelta
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from operator import itemgetter
+
+from json_dumps import dumps
+
+# US area codes (sampling of real area codes)
+AREA_CODES = (
+    "212", "213", "214", "215", "216", "217", "218", "219",
+    "224", "225", "228", "229", "231", "234", "239", "240",
+    "248", "251", "252", "253", "254", "256", "260", "262",
+    "267", "269", "270", "276", "281", "301", "302", "303",
+    "304", "305", "307", "308", "309", "310", "312", "313",
+    "314", "315", "316", "317", "318", "319", "320", "321",
+    "323", "330", "331", "334", "336", "337", "339", "347",
+    "351", "352", "360", "361", "386", "401", "402", "404",
+    "405", "406", "407", "408", "409", "410", "412", "413",
+    "414", "415", "417", "419", "423", "424", "425", "430",
+    "432", "434", "435", "440", "442", "443", "458", "469",
+    "470", "475", "478", "479", "480", "484", "501", "502",
+    "503", "504", "505", "507", "508", "509", "510", "512",
+    "513", "515", "516", "517", "518", "520", "530", "540",
+    "541", "551", "559", "561", "562", "563", "567", "570",
+    "571", "573", "574", "575", "580", "585", "586", "601",
+    "602", "603", "605", "606", "607", "608", "609", "610",
+    "612", "614", "615", "616", "617", "618", "619", "620",
+    "623", "626", "630", "631", "636", "641", "646", "650",
+    "651", "657", "660", "661", "662", "667", "678", "682",
+    "701", "702", "703", "704", "706", "707", "708", "712",
+    "713", "714", "715", "716", "717", "718", "719", "720",
+    "724", "727", "732", "734", "737", "740", "747", "754",
+    "757", "760", "763", "765", "770", "772", "773", "774",
+    "775", "781", "785", "786", "801", "802", "803", "804",
+    "805", "806", "808", "810", "812", "813", "814", "815",
+    "816", "817", "818", "828", "830", "831", "832", "843",
+    "845", "847", "848", "850", "856", "857", "858", "859",
+    "860", "862", "863", "864", "865", "870", "872", "878",
+    "901", "903", "904", "906", "907", "908", "909", "910",
+    "912", "913", "914", "915", "916", "917", "918", "919",
+    "920", "925", "928", "929", "931", "936", "937", "940",
+    "941", "947", "949", "951", "952", "954", "956", "959",
+    "970", "971", "972", "973", "978", "979", "980", "984"
+)
+
+# Various Gmail patterns, called with the lower-cased first and last name, the
+# birth year and a randint; only the chosen pattern is ever formatted
+GMAIL_PATTERNS = (
+    lambda first, last, year, randint: f"{first}.{last}@gmail.com",
+    lambda first, last, year, randint: f"{first}{last}@gmail.com",
+    lambda first, last, year, randint: f"{first}{last[0]}@gmail.com",
+    lambda first, last, year, randint: f"{first[0]}{last}@gmail.com",
+    lambda first, last, year, randint: f"{first}.{last}{randint(1, 99)}@gmail.com",
+    lambda first, last, year, randint: f"{first}{last}{year % 100}@gmail.com",
+    lambda first, last, year, randint: f"{first}_{last}@gmail.com",
+    lambda first, last, year, randint: f"{first}{randint(100, 999)}@gmail.com",
+)
+
 
 class ContactGenerator:
-    def __init__(self):
+    def __init__(self, seed=None):
+        # Seedable RNG with its draw methods pre-bound
+        self._rng = random.Random(seed)
+        self._choice = self._rng.choice
+        self._choices = self._rng.choices
+        self._randint = self._rng.randint
+
         self.first_names_male = [
             "James", "John", "Robert", "Michael", "William", "David", "Richard",
             "Joseph", "Thomas", "Charles", "Christopher", "Daniel", "Matthew",
@@ -91,136 +157,145 @@ class ContactGenerator:
 
     def generate_gmail(self, first_name, last_name, birth_year):
         """Generate a realistic Gmail address"""
-        # Various Gmail patterns
-        patterns = [
-            f"{first_name.lower()}.{last_name.lower()}",
-            f"{first_name.lower()}{last_name.lower()}",
-            f"{first_name.lower()}{last_name[0].lower()}",
-            f"{first_name[0].lower()}{last_name.lower()}",
-            f"{first_name.lower()}.{last_name.lower()}{random.randint(1, 99)}",
-            f"{first_name.lower()}{last_name.lower()}{birth_year % 100}",
-            f"{first_name.lower()}_{last_name.lower()}",
-            f"{first_name.lower()}{random.randint(100, 999)}",
+        pattern = self._choice(GMAIL_PATTERNS)
+        return pattern(first_name.lower(), last_name.lower(), birth_year, self._randint)
+
+    def generate_gmails(self, first_names, last_names, birth_years):
+        """Generate a Gmail address for each name/birth year in a batch"""
+        patterns = self._choices(GMAIL_PATTERNS, k=len(first_names))
+        randint = self._randint
+        return [
+            pattern(first.lower(), last.lower(), year, randint)
+            for pattern, first, last, year in zip(patterns, first_names, last_names,
+                                                  birth_years)
         ]
-        
-        email = random.choice(patterns)
-        return f"{email}@gmail.com"
 
     def generate_phone(self):
         """Generate a realistic US phone number"""
-        # US area codes (sampling of real area codes)
-        area_codes = [
-            "212", "213", "214", "215", "216", "217", "218", "219",
-            "224", "225", "228", "229", "231", "234", "239", "240",
-            "248", "251", "252", "253", "254", "256", "260", "262",
-            "267", "269", "270", "276", "281", "301", "302", "303",
-            "304", "305", "307", "308", "309", "310", "312", "313",
-            "314", "315", "316", "317", "318", "319", "320", "321",
-            "323", "330", "331", "334", "336", "337", "339", "347",
-            "351", "352", "360", "361", "386", "401", "402", "404",
-            "405", "406", "407", "408", "409", "410", "412", "413",
-            "414", "415", "417", "419", "423", "424", "425", "430",
-            "432", "434", "435", "440", "442", "443", "458", "469",
-            "470", "475", "478", "479", "480", "484", "501", "502",
-            "503", "504", "505", "507", "508", "509", "510", "512",
-            "513", "515", "516", "517", "518", "520", "530", "540",
-            "541", "551", "559", "561", "562", "563", "567", "570",
-            "571", "573", "574", "575", "580", "585", "586", "601",
-            "602", "603", "605", "606", "607", "608", "609", "610",
-            "612", "614", "615", "616", "617", "618", "619", "620",
-            "623", "626", "630", "631", "636", "641", "646", "650",
-            "651", "657", "660", "661", "662", "667", "678", "682",
-            "701", "702", "703", "704", "706", "707", "708", "712",
-            "713", "714", "715", "716", "717", "718", "719", "720",
-            "724", "727", "732", "734", "737", "740", "747", "754",
-            "757", "760", "763", "765", "770", "772", "773", "774",
-            "775", "781", "785", "786", "801", "802", "803", "804",
-            "805", "806", "808", "810", "812", "813", "814", "815",
-            "816", "817", "818", "828", "830", "831", "832", "843",
-            "845", "847", "848", "850", "856", "857", "858", "859",
-            "860", "862", "863", "864", "865", "870", "872", "878",
-            "901", "903", "904", "906", "907", "908", "909", "910",
-            "912", "913", "914", "915", "916", "917", "918", "919",
-            "920", "925", "928", "929", "931", "936", "937", "940",
-            "941", "947", "949", "951", "952", "954", "956", "959",
-            "970", "971", "972", "973", "978", "979", "980", "984"
-        ]
-        
-        area_code = random.choice(area_codes)
-        exchange = random.randint(200, 999)  # Exchange code (2-9 for first digit)
-        number = random.randint(1000, 9999)
+        area_code = self._choice(AREA_CODES)
+        exchange = self._randint(200, 999)  # Exchange code (2-9 for first digit)
+        number = self._randint(1000, 9999)
         
         return f"({area_code}) {exchange}-{number}"
 
+    def generate_phones(self, count):
+        """Generate a batch of realistic US phone numbers"""
+        return [
+            f"({area_code}) {exchange}-{number}"
+            for area_code, exchange, number in zip(
+                self._choices(AREA_CODES, k=count),
+                self._choices(range(200, 1000), k=count),
+                self._choices(range(1000, 10000), k=count),
+            )
+        ]
+
     def generate_birth_date(self, min_age=18, max_age=75):
         """Generate a realistic birth date"""
         today = datetime.now()
-        years_ago = random.randint(min_age, max_age)
-        days_ago = random.randint(0, 365)
+        years_ago = self._randint(min_age, max_age)
+        days_ago = self._randint(0, 365)
         
         birth_date = today - timedelta(days=years_ago*365 + days_ago)
         return birth_date.strftime("%Y-%m-%d")
 
+    def generate_birth_dates(self, count, min_age=18, max_age=75, today=None):
+        """Generate a batch of birth dates and their birth years"""
+        # Same age spread as generate_birth_date, drawn as one list of day
+        # offsets and resolved with plain ordinal arithmetic
+        today = (today or date.today()).toordinal()
+        offsets = self._choices(range(min_age * 365, max_age * 365 + 366), k=count)
+        birth_dates = [date.fromordinal(today - offset) for offset in offsets]
+        return [d.isoformat() for d in birth_dates], [d.year for d in birth_dates]
+
     def generate_contact(self):
         """Generate a single fake contact"""
-        # Randomly select gender
-        gender = random.choice(["M", "F"])
+        return self.generate_contacts(1)[0]
+
+    def generate_columns(self, count=100):
+        """Generate contacts as a dict of equally long column lists"""
+        # Each field is drawn or derived for the whole batch in one pass, so
+        # callers that only need some columns never build per-contact dicts
         
-        if gender == "M":
-            first_name = random.choice(self.first_names_male)
-        else:
-            first_name = random.choice(self.first_names_female)
+        # Randomly select gender, then draw first names from each pool
+        genders = self._choices("MF", k=count)
+        n_male = genders.count("M")
+        male_names = iter(self._choices(self.first_names_male, k=n_male))
+        female_names = iter(self._choices(self.first_names_female, k=count - n_male))
+        first_names = [next(male_names) if g == "M" else next(female_names) for g in genders]
+        last_names = self._choices(self.last_names, k=count)
         
-        last_name = random.choice(self.last_names)
+        # One clock read per batch: ages, birth dates and created_date all
+        # agree even if the batch straddles midnight
+        now = datetime.now()
+        created_date = now.strftime("%Y-%m-%d %H:%M:%S")
         
         # Generate birth year for email
-        birth_date = self.generate_birth_date()
-        birth_year = int(birth_date.split("-")[0])
-        
-        # Generate address
-        street_number = random.randint(100, 9999)
-        street_name = random.choice(self.street_names)
+        birth_dates, birth_years = self.generate_birth_dates(count, today=now.date())
         
-        # Add apartment/unit number 30% of the time
-        if random.random() < 0.3:
-            apt_unit = f"Apt {random.randint(1, 999)}"
-            street_address = f"{street_number} {street_name}, {apt_unit}"
-        else:
-            street_address = f"{street_number} {street_name}"
-        
-        city, state = random.choice(self.cities_states)
-        zip_code = f"{random.randint(10000, 99999)}"
+        # Generate address, adding an apartment/unit number 30% of the time
+        street_addresses = [
+            f"{number} {street}, Apt {apt}" if has_apt else f"{number} {street}"
+            for number, street, has_apt, apt in zip(
+                self._choices(range(100, 10000), k=count),
+                self._choices(self.street_names, k=count),
+                self._choices((True, False), weights=(3, 7), k=count),
+                self._choices(range(1, 1000), k=count),
+            )
+        ]
+        cities_states = self._choices(self.cities_states, k=count)
+        cities = [city for city, _ in cities_states]
+        states = [state for _, state in cities_states]
+        zip_codes = [f"{z}" for z in self._choices(range(10000, 100000), k=count)]
         
-        contact = {
-            "first_name": first_name,
-            "last_name": last_name,
-            "full_name": f"{first_name} {last_name}",
-            "email": self.generate_gmail(first_name, last_name, birth_year),
-            "phone": self.generate_phone(),
-            "date_of_birth": birth_date,
-            "age": datetime.now().year - birth_year,
-            "gender": "Male" if gender == "M" else "Female",
-            "street_address": street_address,
-            "city": city,
-            "state": state,
-            "zip_code": zip_code,
-            "full_address": f"{street_address}, {city}, {state} {zip_code}",
-            "created_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return {
+            "first_name": first_names,
+            "last_name": last_names,
+            "full_name": [f"{first} {last}" for first, last in zip(first_names, last_names)],
+            "email": self.generate_gmails(first_names, last_names, birth_years),
+            "phone": self.generate_phones(count),
+            "date_of_birth": birth_dates,
+            "age": [now.year - year for year in birth_years],
+            "gender": ["Male" if g == "M" else "Female" for g in genders],
+            "street_address": street_addresses,
+            "city": cities,
+            "state": states,
+            "zip_code": zip_codes,
+            "full_address": [
+                f"{address}, {city}, {state} {zip_code}"
+                for address, city, state, zip_code in zip(street_addresses, cities,
+                                                          states, zip_codes)
+            ],
+            "created_date": [created_date] * count,
         }
-        
-        return contact
 
-    def generate_contacts(self, count=100):
+    def generate_contacts(self, count=100, workers=1):
         """Generate multiple fake contacts"""
-        contacts = []
-        for _ in range(count):
-            contacts.append(self.generate_contact())
-        return contacts
+        # workers > 1 (None = one per CPU) only pays off for tens of thousands
+        # of contacts; main()'s 200 are generated in-process
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers > 1 and count > 1:
+            return self._generate_in_parallel(count, min(workers, count))
+        
+        columns = self.generate_columns(count)
+        fields = list(columns)
+        return [dict(zip(fields, row)) for row in zip(*columns.values())]
+
+    def _generate_in_parallel(self, count, workers):
+        """Generate contacts as one evenly sized slice per worker process"""
+        # Slice seeds come from self._rng, so a seeded generator returns the
+        # same contacts for a given workers value
+        slices = [
+            (type(self), self._rng.getrandbits(64), count // workers + (i < count % workers))
+            for i in range(workers)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return [c for part in executor.map(_generate_slice, slices) for c in part]
 
     def save_to_json(self, contacts, filename="fake_contacts.json"):
         """Save contacts to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(contacts, f, indent=2, ensure_ascii=False)
+        with open(filename, 'wb') as f:
+            f.write(dumps(contacts))
         print(f"✓ Saved {len(contacts)} contacts to {filename}")
 
     def save_to_csv(self, contacts, filename="fake_contacts.csv"):
@@ -228,13 +303,65 @@ class ContactGenerator:
         if not contacts:
             return
         
-        keys = contacts[0].keys()
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
-            writer.writerows(contacts)
+        fieldnames = list(contacts[0])
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(map(itemgetter(*fieldnames), contacts))
         print(f"✓ Saved {len(contacts)} contacts to {filename}")
 
+    def save_to_csv_gz(self, count=100, filename="fake_contacts.csv.gz", batch_size=1000):
+        """Generate contacts straight into a gzip-compressed CSV file"""
+        # A producer thread generates column batches while this thread
+        # compresses and writes the previous ones. The bounded queue keeps at
+        # most a few batches in memory, however large count is.
+        batches = queue.Queue(maxsize=4)
+        stop = threading.Event()
+        failure = []
+        
+        def put(item):
+            # Give up instead of blocking forever once the writer has stopped
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+        
+        def produce():
+            try:
+                remaining = count
+                while remaining > 0 and not stop.is_set():
+                    size = min(batch_size, remaining)
+                    if not put(self.generate_columns(size)):
+                        return
+                    remaining -= size
+            except Exception as exc:
+                failure.append(exc)
+            finally:
+                put(None)
+        
+        producer = threading.Thread(target=produce, daemon=True)
+        # Level 1 keeps compression close to line rate; text CSV still shrinks a lot
+        with gzip.open(filename, 'wt', newline='', encoding='utf-8', compresslevel=1) as f:
+            producer.start()
+            try:
+                writer = csv.writer(f)
+                header_written = False
+                while (columns := batches.get()) is not None:
+                    if not header_written:
+                        writer.writerow(columns)
+                        header_written = True
+                    writer.writerows(zip(*columns.values()))
+            finally:
+                stop.set()
+                producer.join()
+        
+        if failure:
+            raise failure[0]
+        print(f"✓ Saved {count} contacts to {filename}")
+
     def print_sample(self, contacts, count=5):
         """Print sample contacts"""
         print(f"\n{'='*80}")
@@ -252,6 +379,12 @@ class ContactGenerator:
             print(f"{'-'*80}\n")
 
 
+def _generate_slice(contact_slice):
+    """Generate one slice of contacts inside a worker process"""
+    generator_cls, seed, count = contact_slice
+    return generator_cls(seed).generate_contacts(count)
+
+
 def main():
     """Main function to run the generator"""
     print("=" * 80)
@@ -278,16 +411,13 @@ def main():
     
     # Statistics
     print("\nContact Statistics:")
-    genders = {}
-    states = {}
-    for contact in contacts:
-        genders[contact['gender']] = genders.get(contact['gender'], 0) + 1
-        states[contact['state']] = states.get(contact['state'], 0) + 1
+    genders = Counter(contact['gender'] for contact in contacts)
+    states = Counter(contact['state'] for contact in contacts)
     
-    print(f"  Male: {genders.get('Male', 0)}")
-    print(f"  Female: {genders.get('Female', 0)}")
+    print(f"  Male: {genders['Male']}")
+    print(f"  Female: {genders['Female']}")
     print(f"\nTop 5 States:")
-    for state, count in sorted(states.items(), key=lambda x: x[1], reverse=True)[:5]:
+    for state, count in states.most_common(5):
         print(f"  {state}: {count} contacts")
 
 
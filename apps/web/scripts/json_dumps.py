@@ -0,0 +1,34 @@
+"""
+JSON encoding helpers shared by the data generator scripts
+Uses orjson when it is installed and falls back to the stdlib json module.
+All helpers return UTF-8 bytes.
+"""
+
+try:
+    import orjson
+
+    def dumps(obj):
+        """Encode obj as an indented JSON document with a trailing newline"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+    def dumps_line(obj):
+        """Encode obj as a single NDJSON line"""
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    def dumps_item(obj):
+        """Encode obj indented as an element of a top-level JSON array"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  ")
+except ImportError:
+    import json
+
+    def dumps(obj):
+        """Encode obj as an indented JSON document with a trailing newline"""
+        return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+    def dumps_line(obj):
+        """Encode obj as a single NDJSON line"""
+        return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+    def dumps_item(obj):
+        """Encode obj indented as an element of a top-level JSON array"""
+        return json.dumps(obj, indent=2, ensure_ascii=False).replace("\n", "\n  ").encode("utf-8")